@@ -1,4 +1,11 @@
 if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:  # uvloop only supports linux & macOS, stick to the default loop elsewhere.
+        pass
+    else:
+        uvloop.install()
+
     from core import bot
 
     bot.run(bot.config.DISCORD_TOKEN)
@@ -19,6 +19,7 @@ from .helpers import (
     t_ask_embed,
     MultiScrimConverter,
     csv_tourney_data,
+    invalidate_registration_channels,
 )
 
 from utils import (
@@ -42,6 +43,7 @@ from datetime import datetime, timedelta
 from discord.ext import commands
 
 from tortoise.query_utils import Q
+from tortoise.exceptions import IntegrityError
 from .events import ScrimEvents, TourneyEvents, TagEvents, Ssverification
 from .errors import ScrimError, SMError, TourneyError, PointsError
 
@@ -825,7 +827,7 @@ class ScrimManager(Cog, name="Esports"):
 
         perms = channel.permissions_for(ctx.me)
 
-        if not all((perms.manage_messages, perms.add_reactions, perms.manage_channels)):
+        if not (perms.manage_messages and perms.add_reactions and perms.manage_channels):
             raise TourneyError(
                 f"Please make sure I have `add_reactions`, `manage_messages` & `manage_channel` permission in {channel.mention}."
             )
@@ -878,13 +880,19 @@ class ScrimManager(Cog, name="Esports"):
         if not confirm:
             await ctx.send("Ok, Aborting!")
         else:
+            # the setup can take minutes, someone else may have taken the channel meanwhile.
+            if await Tourney.filter(registration_channel_id=tourney.registration_channel_id).exists():
+                raise TourneyError(f"Another tourney is running in {tourney.registration_channel.mention}.")
+
             message = await ctx.send("Setting up everything...")
             reason = "Created for tournament management."
+            created = []  # roles and channels made by this setup, removed again if the save fails.
 
             # Tourney MODS
 
             if not (tourney_mod := tourney.modrole):
                 tourney_mod = await ctx.guild.create_role(name="tourney-mod", color=self.bot.color, reason=reason)
+                created.append(tourney_mod)
 
             overwrite = tourney.registration_channel.overwrites_for(ctx.guild.default_role)
             overwrite.update(read_messages=True, send_messages=True, read_message_history=True)
@@ -905,6 +913,7 @@ class ScrimManager(Cog, name="Esports"):
                     reason=reason,
                     topic="**DO NOT RENAME THIS CHANNEL**",
                 )
+                created.append(tourney_log_channel)
 
                 # Sending Message to tourney-log-channel
                 note = await tourney_log_channel.send(
@@ -930,13 +939,24 @@ class ScrimManager(Cog, name="Esports"):
                 guild.me: discord.PermissionOverwrite(manage_channels=True, manage_permissions=True),
             }
             slotm_channel = await _category.create_text_channel(name="tourney-slotmanager", overwrites=overwrites)
+            created.append(slotm_channel)
 
             _e = TourneySlotManager.initial_embed(tourney)
             tourney.slotm_message_id = (await slotm_channel.send(embed=_e, view=_view)).id
 
             tourney.slotm_channel_id = slotm_channel.id
 
-            await tourney.save()
+            try:
+                await tourney.save()
+            except IntegrityError:
+                # registration_channel_id is unique, another setup saved this channel first.
+                for obj in reversed(created):
+                    with suppress(discord.HTTPException):
+                        await obj.delete(reason="Tourney setup failed.")
+
+                await invalidate_registration_channels(ctx.guild.id)
+                raise TourneyError(f"Another tourney is running in {tourney.registration_channel.mention}.")
+
             text = f"Tourney Management Setup Complete. (`Tourney ID: {tourney.id}`)\nUse `{ctx.prefix}tourney start {tourney.id}` to start the tourney."
             try:
                 await message.edit(content=text)
@@ -19,6 +19,7 @@ from .helpers import (
     delete_denied_message,
     scrim_work_role,
     tourney_work_role,
+    invalidate_registration_channels,
 )
 from constants import EsportsRole, EsportsLog, RegDeny
 from discord.ext import commands
@@ -335,6 +336,7 @@ class SMError(Cog):
 
         await Scrim.filter(registration_channel_id=channel.id).delete()
         await Tourney.filter(registration_channel_id=channel.id).delete()
+        await invalidate_registration_channels(channel.guild.id)
         await TagCheck.filter(channel_id=channel.id).delete()
         await EasyTag.filter(channel_id=channel.id).delete()
 
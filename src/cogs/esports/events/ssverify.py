@@ -31,7 +31,7 @@ class Ssverification(Cog):
 
     @Cog.listener()
     async def on_message(self, message: discord.Message):
-        if not all((message.guild, not message.author.bot, message.channel.id in self.bot.cache.ssverify_channels)):
+        if not (message.guild and not message.author.bot and message.channel.id in self.bot.cache.ssverify_channels):
             return
 
         record = await SSVerify.get_or_none(channel_id=message.channel.id)
@@ -181,7 +181,7 @@ class TourneyEvents(Cog):
 
     @Cog.listener(name="on_message")
     async def on_media_partner_message(self, message: discord.Message):
-        if not all((message.guild, not message.author.bot, message.channel.id in self.bot.cache.media_partner_channels)):
+        if not (message.guild and not message.author.bot and message.channel.id in self.bot.cache.media_partner_channels):
             return
 
         media_partner = await MediaPartner.get_or_none(pk=message.channel.id)
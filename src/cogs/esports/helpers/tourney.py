@@ -15,6 +15,9 @@ import io
 import discord
 import re
 
+from aiocache import SimpleMemoryCache
+from tortoise.signals import post_save, post_delete
+
 
 def get_tourney_slots(slots: List[TMSlot]) -> int:
     for slot in slots:
@@ -133,3 +136,31 @@ async def get_tourney_from_channel(guild_id: int, channel_id: int) -> Optional[T
     for tourney in tourneys:
         if await tourney.media_partners.filter(pk=channel_id).exists():
             return tourney
+
+
+_registered_channels = SimpleMemoryCache(ttl=60, namespace="tourney_reg_channels")  # guild_id -> set of channel ids
+
+
+async def registration_channels(guild_id: int) -> set:
+    """
+    Registration channel ids of all tourneys in a guild, cached for 60 seconds.
+    """
+    _ids = await _registered_channels.get(guild_id)
+    if _ids is None:
+        _ids = set(await Tourney.filter(guild_id=guild_id).values_list("registration_channel_id", flat=True))
+        await _registered_channels.set(guild_id, _ids)
+
+    return _ids
+
+
+async def invalidate_registration_channels(guild_id: int):
+    """
+    Must be called after queryset update()/delete() on tourneys, those don't fire model signals.
+    """
+    await _registered_channels.delete(guild_id)
+
+
+@post_save(Tourney)
+@post_delete(Tourney)
+async def _invalidate_on_signal(sender, instance: Tourney, *args):
+    await invalidate_registration_channels(instance.guild_id)
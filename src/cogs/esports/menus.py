@@ -341,11 +341,10 @@ class IDPMenu(menus.Menu):
     async def set_title(self, payload):
         msg = await self.cembed(f"What do you want the title to be?\n\nTitle cannot exceed 256 characters.")
 
-        title = await inputs.string_input(self.ctx, self.check, delete_after=True)
+        title = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=msg)
         if len(title) > 256:
             return await self.ctx.error(f"Title cannot exceed 256 characters.", delete_after=3)
 
-        await inputs.safe_delete(msg)
         if title.lower() == "none":
             self.embed.title = discord.Embed.Empty
         else:
@@ -356,9 +355,8 @@ class IDPMenu(menus.Menu):
     async def set_id(self, payload):
         msg = await self.cembed(f"What is the ID of custom room?")
 
-        _id = await inputs.string_input(self.ctx, self.check, delete_after=True)
+        _id = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
-        await inputs.safe_delete(msg)
         self.embed.set_field_at(0, name="Room ID", value=_id)
         self._id = _id
         await self.refresh()
@@ -367,9 +365,8 @@ class IDPMenu(menus.Menu):
     async def set_pass(self, payload):
         msg = await self.cembed(f"What is the password for room?")
 
-        _pass = await inputs.string_input(self.ctx, self.check, delete_after=True)
+        _pass = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
-        await inputs.safe_delete(msg)
         self.embed.set_field_at(1, name="Password", value=_pass)
         self._pass = _pass
         await self.refresh()
@@ -378,9 +375,8 @@ class IDPMenu(menus.Menu):
     async def set_map(self, payload):
         msg = await self.cembed(f"What is the name of map?")
 
-        _map = await inputs.string_input(self.ctx, self.check, delete_after=True)
+        _map = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
-        await inputs.safe_delete(msg)
         self.embed.set_field_at(2, name="Maps", value=_map)
         await self.refresh()
 
@@ -388,18 +384,15 @@ class IDPMenu(menus.Menu):
     async def set_starttime(self, payload):
         msg = await self.cembed(f"What is the match start time?")
 
-        start_time = await inputs.string_input(self.ctx, self.check, delete_after=True)
+        start_time = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
-        await inputs.safe_delete(msg)
         self.embed.set_field_at(3, name="Match Starts at", value=start_time)
         await self.refresh()
 
     @menus.button("🖼️")
     async def set_thumbnail(self, payload):
         msg = await self.cembed(f"Enter the Image URL you want to set as thumbnail.")
-        image = await inputs.string_input(self.ctx, self.check, delete_after=True)
-
-        await inputs.safe_delete(msg)
+        image = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         if image.lower() == "none":
             self.embed.set_thumbnail(url=discord.Embed.Empty)
@@ -432,8 +425,7 @@ class IDPMenu(menus.Menu):
         msg = await self.cembed(
             f"After how many minutes do you want me to delete the idp message?\nIt can be between 1-30"
         )
-        delete_time = await inputs.integer_input(self.ctx, self.check, delete_after=True, limits=(None, None))
-        await inputs.safe_delete(msg)
+        delete_time = await inputs.integer_input(self.ctx, self.check, delete_after=True, limits=(None, None), prompt=msg)
         self.delete_in = delete_time
         self.embed.set_footer(
             text=f"Shared by: {self.ctx.author} • Auto delete in {plural(self.delete_in):minute|minutes}",
@@ -511,8 +503,7 @@ class AutocleanMenu(menus.Menu):
             "**Currently Quotient works according to Indian Standard Time (UTC+05:30)**"
         )
 
-        clean_time = await inputs.time_input(self.ctx, self.check, delete_after=True)
-        await inputs.safe_delete(msg)
+        clean_time = await inputs.time_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         await self.bot.get_cog("Reminders").create_timer(
             clean_time,
@@ -655,13 +646,13 @@ class ConfigEditMenu(menus.Menu):
             self.ctx,
             self.check,
             delete_after=True,
+            prompt=msg,
         )
         if len(name) > 30:
             raise ScrimError("Scrims Name cannot exceed 30 characters.")
         elif len(name) < 5:
             raise ScrimError("The length of new name is too short.")
 
-        await inputs.safe_delete(msg)
         await self.update_scrim(name=name)
 
     @menus.button(regional_indicator("B"))
@@ -671,8 +662,8 @@ class ConfigEditMenu(menus.Menu):
             self.ctx,
             self.check,
             delete_after=True,
+            prompt=msg,
         )
-        await inputs.safe_delete(msg)
         await self.update_scrim(registration_channel_id=channel.id)
 
     @menus.button(regional_indicator("C"))
@@ -682,8 +673,8 @@ class ConfigEditMenu(menus.Menu):
             self.ctx,
             self.check,
             delete_after=True,
+            prompt=msg,
         )
-        await inputs.safe_delete(msg)
         await self.update_scrim(slotlist_channel_id=channel.id)
 
     @menus.button(regional_indicator("D"))
@@ -693,8 +684,8 @@ class ConfigEditMenu(menus.Menu):
             self.ctx,
             self.check,
             delete_after=True,
+            prompt=msg,
         )
-        await inputs.safe_delete(msg)
         await self.update_scrim(role_id=role.id)
 
     @menus.button(regional_indicator("E"))
@@ -705,8 +696,8 @@ class ConfigEditMenu(menus.Menu):
             self.check,
             delete_after=True,
             limits=(0, 10),
+            prompt=msg,
         )
-        await inputs.safe_delete(msg)
         await self.update_scrim(required_mentions=mentions)
 
     @menus.button(regional_indicator("F"))
@@ -717,8 +708,8 @@ class ConfigEditMenu(menus.Menu):
             self.check,
             delete_after=True,
             limits=(1, 30),
+            prompt=msg,
         )
-        await inputs.safe_delete(msg)
         await self.update_scrim(total_slots=slots)
 
     @menus.button(regional_indicator("G"))
@@ -729,8 +720,7 @@ class ConfigEditMenu(menus.Menu):
             "**Currently Quotient works according to Indian Standard Time (UTC+05:30)**"
         )
 
-        open_time = await inputs.time_input(self.ctx, self.check, delete_after=True)
-        await inputs.safe_delete(msg)
+        open_time = await inputs.time_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         await self.bot.get_cog("Reminders").create_timer(
             open_time,
@@ -752,8 +742,8 @@ class ConfigEditMenu(menus.Menu):
             self.ctx,
             self.check,
             delete_after=True,
+            prompt=msg,
         )
-        await inputs.safe_delete(msg)
         await self.update_scrim(ping_role_id=role.id)
 
     @menus.button(regional_indicator("J"))
@@ -764,9 +754,9 @@ class ConfigEditMenu(menus.Menu):
             self.ctx,
             self.check,
             delete_after=True,
+            prompt=msg,
         )
 
-        await inputs.safe_delete(msg)
         await self.update_scrim(open_role_id=role.id)
 
     @menus.button(regional_indicator("K"))
@@ -787,9 +777,9 @@ class ConfigEditMenu(menus.Menu):
             self.check,
             delete_after=True,
             limits=(1, self.scrim.total_slots),
+            prompt=m,
         )
 
-        await inputs.safe_delete(m)
         await self.update_scrim(start_from=start_from)
 
     @menus.button(regional_indicator("M"))
@@ -8,6 +8,7 @@ if typing.TYPE_CHECKING:
 from contextlib import suppress
 from core import Context
 import discord
+import asyncio
 
 
 class EsportsBaseView(discord.ui.View):
@@ -21,6 +22,26 @@ class EsportsBaseView(discord.ui.View):
         self.bot: Quotient = ctx.bot
         self.check = lambda msg: msg.channel == self.ctx.channel and msg.author == self.ctx.author
 
+        self._refresh_task: typing.Optional[asyncio.Task] = None
+        self._refresh_pending = False
+
+    def schedule_refresh(self, delay: float = 0.25):
+        """
+        Coalesce a burst of refresh_view() calls so the message is edited at most once every `delay` seconds.
+        """
+        self._refresh_pending = True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.bot.loop.create_task(self.__refresh_loop(delay))
+
+    async def __refresh_loop(self, delay: float):
+        while self._refresh_pending:
+            await asyncio.sleep(delay)
+            self._refresh_pending = False
+            try:
+                await self.refresh_view()
+            except Exception as e:
+                self.ctx.bot.dispatch("command_error", self.ctx, e)
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.ctx.author.id:
             await interaction.response.send_message(
@@ -30,6 +51,12 @@ class EsportsBaseView(discord.ui.View):
         return True
 
     async def on_timeout(self) -> None:
+        # a queued refresh would re-enable the buttons on a view that is already discarded.
+        self._refresh_pending = False
+        if self._refresh_task and not self._refresh_task.done() and self._refresh_task is not asyncio.current_task():
+            self._refresh_task.cancel()
+        self.stop()
+
         if hasattr(self, "message"):
             for b in self.children:
                 if isinstance(b, discord.ui.Button) and not b.style == discord.ButtonStyle.link:
@@ -77,9 +77,8 @@ class SlotReserver(discord.ui.View):
             image="https://cdn.discordapp.com/attachments/851846932593770496/882492600542720040/reserve_docs.gif",
         )
 
-        slot = await string_input(self.ctx, self.check, delete_after=True)
+        slot = await string_input(self.ctx, self.check, delete_after=True, prompt=m)
 
-        await self.ctx.safe_delete(m)
         if slot.strip().lower() == "cancel":
             return await self.error_embed("Alright, Aborting.")
 
@@ -132,8 +131,7 @@ class SlotReserver(discord.ui.View):
             "\nFor Example:\n`1, 2, 5, 10`"
         )
 
-        slots = await string_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(m)
+        slots = await string_input(self.ctx, self.check, delete_after=True, prompt=m)
         if slots.strip().lower() == "cancel":
             return await self.error_embed("Alright, Aborting.")
 
@@ -51,10 +51,8 @@ class ScrimEditor(EsportsBaseView):
             "What should be the new name of this scrim?\n\n" "`Please Keep this under 30 characters.`"
         )
 
-        new_name = await inputs.string_input(self.ctx, self.check, delete_after=True)
+        new_name = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         new_name = truncate_string(new_name.strip(), 30)
 
-        await self.ctx.safe_delete(msg)
-
         await self.__update_scrim(name=new_name)
@@ -65,8 +65,7 @@ class SlotlistFormatter(EsportsBaseView):
             "Enter `none` to remove the title field."
         )
 
-        title = await string_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(msg)
+        title = await string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         if (_title := title.strip().lower()) == "none":
             self.__current_embed.title = discord.Embed.Empty
@@ -86,8 +85,7 @@ class SlotlistFormatter(EsportsBaseView):
             "Enter `none` to remove the decription field."
         )
 
-        description = await string_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(msg)
+        description = await string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         if (_desc := description.strip().lower()) == "none":
             self.__current_embed.description = f"```{self.__slotstr * 6}```"
@@ -106,8 +104,7 @@ class SlotlistFormatter(EsportsBaseView):
             "Enter `none` to remove the footer field."
         )
 
-        footer = await string_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(msg)
+        footer = await string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         if (_title := footer.strip().lower()) == "none":
             self.__current_embed.set_footer(text=discord.Embed.Empty)
@@ -126,8 +123,7 @@ class SlotlistFormatter(EsportsBaseView):
             "Enter `none` to remove previous thumbnail."
         )
 
-        image = await image_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(msg)
+        image = await image_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         self.__current_embed.set_thumbnail(url=image) if image else self.__current_embed.set_thumbnail(
             url=discord.Embed.Empty
@@ -144,8 +140,7 @@ class SlotlistFormatter(EsportsBaseView):
             "Enter `none` to remove previous image."
         )
 
-        image = await image_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(msg)
+        image = await image_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         self.__current_embed.set_image(url=image) if image else self.__current_embed.set_image(url=discord.Embed.Empty)
 
@@ -160,8 +155,7 @@ class SlotlistFormatter(EsportsBaseView):
             "Enter `none` to keep the color invisible."
         )
 
-        color = await string_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(msg)
+        color = await string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         if (_color := color.strip().lower()) == "none":
             self.__current_embed.color = 0x2F3136
@@ -20,9 +20,7 @@ class SetChannel(discord.ui.Button):
         await interaction.response.defer()
 
         _m = await self.ctx.simple("Mention the channel you want to use for ssverification.")
-        channel = await inputs.channel_input(self.ctx, delete_after=True)
-
-        await self.ctx.safe_delete(_m)
+        channel = await inputs.channel_input(self.ctx, delete_after=True, prompt=_m)
 
         if await SSVerify.filter(pk=channel.id).exists():
             return await self.ctx.error(f"{channel.mention} is already a ssverification channel.", 3)
@@ -45,9 +43,8 @@ class SetRole(discord.ui.Button):
         await interaction.response.defer()
 
         _m = await self.ctx.simple("Mention the role you want to give for ssverification.")
-        role = await inputs.role_input(self.ctx, delete_after=True)
+        role = await inputs.role_input(self.ctx, delete_after=True, prompt=_m)
 
-        await self.ctx.safe_delete(_m)
         self.view.record.role_id = role.id
 
         await self.view.refresh_view()
@@ -63,9 +60,8 @@ class RequiredSS(discord.ui.Button):
         await interaction.response.defer()
 
         _m = await self.ctx.simple("How many screenshots do you need me to verify?")
-        _ss = await inputs.integer_input(self.ctx, delete_after=True)
+        _ss = await inputs.integer_input(self.ctx, delete_after=True, prompt=_m)
 
-        await self.ctx.safe_delete(_m)
         self.view.record.required_ss = _ss
 
         await self.view.refresh_view()
@@ -96,8 +92,7 @@ class ScreenshotType(discord.ui.Button):
                 _m = await self.ctx.simple(
                     "What name do want to give this filter?\n\n" "Enter any name relevant to what you want to verify.\n"
                 )
-                _name = await inputs.string_input(self.ctx, delete_after=True)
-                await self.ctx.safe_delete(_m)
+                _name = await inputs.string_input(self.ctx, delete_after=True, prompt=_m)
                 _name = truncate_string(_name, max_length=50)
 
                 _m = await self.ctx.simple(
@@ -105,8 +100,7 @@ class ScreenshotType(discord.ui.Button):
                     "anything that you believe to be common in the screenshots.\n\n"
                     "*Separate with comma `,`*"
                 )
-                _keys = await inputs.string_input(self.ctx, delete_after=True)
-                await self.ctx.safe_delete(_m)
+                _keys = await inputs.string_input(self.ctx, delete_after=True, prompt=_m)
 
                 _keys = _keys.split(",")
                 self.view.record.keywords = [_name, *[truncate_string(i, 50).strip() for i in _keys]]
@@ -137,9 +131,8 @@ class PageName(discord.ui.Button):
         await interaction.response.defer()
 
         _m = await self.ctx.simple("Enter the exact name of your page/channel.")
-        _name = await inputs.string_input(self.ctx, delete_after=True)
+        _name = await inputs.string_input(self.ctx, delete_after=True, prompt=_m)
 
-        await self.ctx.safe_delete(_m)
         self.view.record.channel_name = truncate_string(_name, 30)
         await self.view.refresh_view()
 
@@ -154,9 +147,8 @@ class PageLink(discord.ui.Button):
         await interaction.response.defer()
 
         _m = await self.ctx.simple("Enter the direct link to your page/channel.")
-        _name = await inputs.string_input(self.ctx, delete_after=True)
+        _name = await inputs.string_input(self.ctx, delete_after=True, prompt=_m)
 
-        await self.ctx.safe_delete(_m)
         self.view.record.channel_link = truncate_string(_name, 130)
         await self.view.refresh_view()
 
@@ -187,8 +179,7 @@ class SuccessMessage(discord.ui.Button):
             "\n`Kindly keep it under 500 characters. Enter none to remove it.`"
         )
 
-        msg = await inputs.string_input(self.ctx, delete_after=True)
-        await self.ctx.safe_delete(m)
+        msg = await inputs.string_input(self.ctx, delete_after=True, prompt=m)
 
         msg = truncate_string(msg, 500)
         if msg.lower().strip() == "none":
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import discord
 from typing import Optional
+from contextlib import suppress
 
 from ._editor import TourneyEditor
 
@@ -11,3 +12,27 @@ class TourneyButton(discord.ui.Button):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+
+    async def defer(self, interaction: discord.Interaction):
+        """
+        ACK the interaction before doing any slow work. Already expired interactions (10062) are ignored,
+        `ask()` falls back to a channel message for those.
+        """
+        with suppress(discord.NotFound):
+            await interaction.response.defer()
+
+    async def ask(
+        self, interaction: discord.Interaction, message: str, *, image: str = None
+    ) -> Optional[discord.Message]:
+        """
+        Send an input prompt as an ephemeral followup, which never needs to be deleted.
+        If the interaction couldn't be deferred, the prompt is sent in the channel and returned for deletion.
+        """
+        _e = discord.Embed(color=self.view.bot.color, description=message)
+        if image:
+            _e.set_image(url=image)
+
+        if not interaction.response.is_done():
+            return await self.ctx.send(embed=_e, embed_perms=True)
+
+        await interaction.followup.send(embed=_e, ephemeral=True)
@@ -6,243 +6,244 @@ import discord
 from utils import regional_indicator as ri, inputs, truncate_string, emote
 
 from ._base import TourneyButton
-from models import Tourney
+from ...helpers import registration_channels
+
+from string import ascii_letters
 
 #! create tourney.full_delete() method
 #! increase success message limit to 500
 #! fake tags maybe
 #! disable tourney slotm in delete
 
+_RI_CACHE = {c: ri(c) for c in ascii_letters}
+
 
 class SetTourneyname(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        m = await self.ctx.simple("Enter the new name of the tournament. (`Max 30 characters`)")
-        name = await inputs.string_input(self.ctx, delete_after=True)
-        await self.ctx.safe_delete(m)
+        await self.defer(interaction)
+        m = await self.ask(interaction, "Enter the new name of the tournament. (`Max 30 characters`)")
+        name = await inputs.string_input(self.ctx, delete_after=True, prompt=m)
         self.view.record.name = truncate_string(name, 30)
 
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class RegChannel(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
-        m = await self.ctx.simple("Mention the channel where you want to take registrations.")
-        channel = await inputs.channel_input(self.ctx, delete_after=True)
-        await self.ctx.safe_delete(m)
+        m = await self.ask(interaction, "Mention the channel where you want to take registrations.")
+        channel = await inputs.channel_input(self.ctx, delete_after=True, prompt=m)
 
-        if await Tourney.filter(registration_channel_id=channel.id).exists():
+        if channel.id in await registration_channels(self.ctx.guild.id):
             return await self.ctx.error(f"Another tourney is running in {channel.mention}.", 4)
         self.view.record.registration_channel_id = channel.id
 
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class ConfirmChannel(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
+
+        m = await self.ask(interaction, "Mention the channel where you want me to post registration confirm messages.")
+        channel = await inputs.channel_input(self.ctx, delete_after=True, prompt=m)
 
-        m = await self.ctx.simple("Mention the channel where you want me to post registration confirm messages.")
-        channel = await inputs.channel_input(self.ctx, delete_after=True)
-        await self.ctx.safe_delete(m)
+        _reg_channels = await registration_channels(self.ctx.guild.id)
+        if channel.id == self.view.record.registration_channel_id or channel.id in _reg_channels:
+            return await self.ctx.error(f"{channel.mention} is a registration channel, it can't be a confirm channel.", 4)
 
         self.view.record.confirm_channel_id = channel.id
 
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class SetRole(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
-        m = await self.ctx.simple("Mention the role you want to give for correct registration.")
-        role = await inputs.role_input(self.ctx, delete_after=True)
-        await self.ctx.safe_delete(m)
+        m = await self.ask(interaction, "Mention the role you want to give for correct registration.")
+        role = await inputs.role_input(self.ctx, delete_after=True, prompt=m)
 
         self.view.record.role_id = role.id
 
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class SetMentions(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
-        m = await self.ctx.simple("How many mentions are required for registration? (Max `10`)")
-        mentions = await inputs.integer_input(self.ctx, delete_after=True, limits=(0, 10))
-        await self.ctx.safe_delete(m)
+        m = await self.ask(interaction, "How many mentions are required for registration? (Max `10`)")
+        mentions = await inputs.integer_input(self.ctx, delete_after=True, limits=(0, 10), prompt=m)
 
         self.view.record.required_mentions = mentions
 
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class SetPingRole(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
-        m = await self.ctx.simple("Mention the role you want to ping with registration open message.")
-        role = await inputs.role_input(self.ctx, delete_after=True)
-        await self.ctx.safe_delete(m)
+        m = await self.ask(interaction, "Mention the role you want to ping with registration open message.")
+        role = await inputs.role_input(self.ctx, delete_after=True, prompt=m)
 
-        self.view.record.ping_role_id = role
+        self.view.record.ping_role_id = role.id
 
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class SetSlots(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
-        m = await self.ctx.simple("How many total slots are there? (Max `15000`)")
-        slots = await inputs.integer_input(self.ctx, delete_after=True, limits=(1, 15000))
-        await self.ctx.safe_delete(m)
+        m = await self.ask(interaction, "How many total slots are there? (Max `15000`)")
+        slots = await inputs.integer_input(self.ctx, delete_after=True, limits=(1, 15000), prompt=m)
 
         self.view.record.total_slots = slots
 
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class SetEmojis(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        ...
+        await self.defer(interaction)
 
 
 class OpenRole(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
-        m = await self.ctx.simple("Mention the role for which you want to open/close registrations.")
-        role = await inputs.role_input(self.ctx, delete_after=True)
-        await self.ctx.safe_delete(m)
+        m = await self.ask(interaction, "Mention the role for which you want to open/close registrations.")
+        role = await inputs.role_input(self.ctx, delete_after=True, prompt=m)
 
-        self.view.record.open_role_id = role
+        self.view.record.open_role_id = role.id
 
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class MultiReg(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
         self.view.record.multiregister = not self.view.record.multiregister
         await self.ctx.success(
             f"Now users **{'can' if self.view.record.multiregister else 'can not'}** register more than once.", 3
         )
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class TeamCompulsion(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
         self.view.record.teamname_compulsion = not self.view.record.teamname_compulsion
         await self.ctx.success(
             f"Now Team Name **{'is' if self.view.record.teamname_compulsion else 'is not'}** required to register.", 3
         )
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class DuplicateTeamName(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
         self.view.record.no_duplicate_name = not self.view.record.no_duplicate_name
         await self.ctx.success(
             f"Duplicate team names are now **{'allowed' if self.view.record.no_duplicate_name else 'not allowed'}**.", 3
         )
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class AutodeleteRejected(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
         self.view.record.autodelete_rejected = not self.view.record.autodelete_rejected
         await self.ctx.success(
             f"Rejected registrations will **{'be' if self.view.record.autodelete_rejected else 'not be'}** deleted automatically.",
             3,
         )
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class SuccessMessage(TourneyButton):
     def __init__(self, ctx: Context, letter: str):
-        super().__init__(emoji=ri(letter))
+        super().__init__(emoji=_RI_CACHE[letter])
 
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
-        m = await self.ctx.simple(
+        m = await self.ask(
+            interaction,
             "What message do you want me to show for successful registration? This message will be sent to "
             "DM of players who register successfully.\n\n**Current Success Message:**"
             f"```{self.view.record.success_message if self.view.record.success_message else 'Not Set Yet.'}```"
@@ -250,8 +251,7 @@ class SuccessMessage(TourneyButton):
             image="https://cdn.discordapp.com/attachments/851846932593770496/900977642382163988/unknown.png",
         )
 
-        msg = await inputs.string_input(self.ctx, delete_after=True)
-        await self.ctx.safe_delete(m)
+        msg = await inputs.string_input(self.ctx, delete_after=True, prompt=m)
 
         msg = truncate_string(msg, 500)
         if msg.lower().strip() == "none":
@@ -265,7 +265,7 @@ class SuccessMessage(TourneyButton):
             await self.ctx.success("Success Message Updated.", 3)
 
         self.view.record.success_message = msg
-        await self.view.refresh_view()
+        self.view.schedule_refresh()
 
 
 class DeleteTourney(TourneyButton):
@@ -275,7 +275,7 @@ class DeleteTourney(TourneyButton):
         self.ctx = ctx
 
     async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
+        await self.defer(interaction)
 
         prompt = await self.ctx.prompt(
             "Are you sure you want to delete this tourney?\n\n`This action is not reversible.`"
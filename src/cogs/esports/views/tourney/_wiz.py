@@ -6,6 +6,7 @@ from core import Context
 from models import Tourney
 
 from ._buttons import *
+from ._buttons import _RI_CACHE
 from string import ascii_uppercase
 from ..ssmod._buttons import DiscardButton
 
@@ -45,7 +46,7 @@ class TourneySetupWizard(EsportsBaseView):
 
         for idx, (name, value) in enumerate(fields.items()):
             _e.add_field(
-                name=f"{ri(ascii_uppercase[idx])} {name}:",
+                name=f"{_RI_CACHE[ascii_uppercase[idx]]} {name}:",
                 value=value,
             )
 
@@ -54,14 +55,12 @@ class TourneySetupWizard(EsportsBaseView):
     async def refresh_view(self):
         _e = self.initial_message()
 
-        if all(
-            (
-                self.record.registration_channel_id,
-                self.record.role_id,
-                self.record.confirm_channel_id,
-                self.record.required_mentions,
-                self.record.total_slots,
-            )
+        if (
+            self.record.registration_channel_id
+            and self.record.role_id
+            and self.record.confirm_channel_id
+            and self.record.required_mentions
+            and self.record.total_slots
         ):
             self.children[-1].disabled = False
 
@@ -2,7 +2,8 @@ from ...views.base import EsportsBaseView
 from core import Context
 from models import Tourney
 
-from ...helpers import tourney_work_role
+from ...helpers import tourney_work_role, registration_channels, invalidate_registration_channels
+from tortoise.exceptions import IntegrityError
 
 from utils import regional_indicator as ri, inputs, truncate_string, emote
 
@@ -56,6 +57,7 @@ class TourneyEditor(EsportsBaseView):
 
     async def update_tourney(self, **kwargs):
         await Tourney.filter(pk=self.tourney.id).update(**kwargs)
+        await invalidate_registration_channels(self.tourney.guild_id)
         await self.__refresh_view()
 
     async def __refresh_view(self):
@@ -74,12 +76,10 @@ class TourneyEditor(EsportsBaseView):
             "What should be the new name of this tourney?\n\n" "`Please Keep this under 30 characters.`"
         )
 
-        new_name = await inputs.string_input(self.ctx, self.check, delete_after=True)
+        new_name = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         new_name = truncate_string(new_name.strip(), 30)
 
-        await self.ctx.safe_delete(msg)
-
         await self.update_tourney(name=new_name)
 
     @discord.ui.button(style=discord.ButtonStyle.secondary, custom_id="tourney_reg_channel", emoji=ri("b"), row=1)
@@ -90,17 +90,25 @@ class TourneyEditor(EsportsBaseView):
             "Which channel do you want to use as registration channel.\n\n`Mention the channel or enter its ID.`"
         )
 
-        channel = await inputs.channel_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(msg)
+        channel = await inputs.channel_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         perms = channel.permissions_for(self.ctx.me)
 
-        if not all((perms.manage_messages, perms.add_reactions, perms.manage_channels)):
+        if not (perms.manage_messages and perms.add_reactions and perms.manage_channels):
             return await self.error_embed(
                 f"Please make sure I have `add_reactions` and `manage_messages` permission in {channel.mention}."
             )
 
-        await self.update_tourney(registration_channel_id=channel.id)
+        _reg_channels = await registration_channels(self.ctx.guild.id)
+        if channel.id != self.tourney.registration_channel_id and channel.id in _reg_channels:
+            return await self.error_embed(f"Another tourney is running in {channel.mention}.")
+
+        # registration_channel_id is unique, the db has the final say if two editors race for one channel.
+        try:
+            await self.update_tourney(registration_channel_id=channel.id)
+        except IntegrityError:
+            await invalidate_registration_channels(self.ctx.guild.id)
+            return await self.error_embed(f"Another tourney is running in {channel.mention}.")
 
     @discord.ui.button(style=discord.ButtonStyle.secondary, custom_id="tourney_confirm_channel", emoji=ri("c"), row=1)
     async def set_confirm_channel(self, button: discord.Button, interaction: discord.Interaction):
@@ -110,12 +118,11 @@ class TourneyEditor(EsportsBaseView):
             "Which channel do you want to use as confirmation channel.\n\n`Mention the channel or enter its ID.`"
         )
 
-        channel = await inputs.channel_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(msg)
+        channel = await inputs.channel_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         perms = channel.permissions_for(self.ctx.me)
 
-        if not all((perms.manage_messages, perms.add_reactions)):
+        if not (perms.manage_messages and perms.add_reactions):
             return await self.error_embed(
                 f"Please make sure I have `add_reactions` and `manage_messages` permission in {channel.mention}."
             )
@@ -129,9 +136,7 @@ class TourneyEditor(EsportsBaseView):
         msg = await self.ask_embed(
             "Which role do you want me to give for successful registration?\n\n" "`Mention the role or Enter its ID.`"
         )
-        role = await inputs.role_input(self.ctx, self.check, delete_after=True)
-
-        await self.ctx.safe_delete(msg)
+        role = await inputs.role_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         if not self.ctx.me.guild_permissions.manage_roles:
             return await self.error_embed("Unfortunately I don't have `manage_roles` permission.")
@@ -145,8 +150,7 @@ class TourneyEditor(EsportsBaseView):
         msg = await self.ask_embed(
             "How many mentions are required for successful registration?\n\n" "`Enter a number between 0 or 10.`"
         )
-        mentions = await inputs.integer_input(self.ctx, self.check, delete_after=True, limits=(0, 10))
-        await self.ctx.safe_delete(msg)
+        mentions = await inputs.integer_input(self.ctx, self.check, delete_after=True, limits=(0, 10), prompt=msg)
 
         await self.update_tourney(required_mentions=mentions)
 
@@ -157,9 +161,7 @@ class TourneyEditor(EsportsBaseView):
         msg = await self.ask_embed(
             "Which role do you want me to ping when registration opens?\n\n" "`Mention the role or Enter its ID.`"
         )
-        role = await inputs.role_input(self.ctx, self.check, delete_after=True)
-
-        await self.ctx.safe_delete(msg)
+        role = await inputs.role_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         await self.update_tourney(ping_role_id=role.id)
 
@@ -170,8 +172,7 @@ class TourneyEditor(EsportsBaseView):
         msg = await self.ask_embed(
             "How many total slots do you want to set?\n\n" "`Total slots cannot be more than 10,000.`"
         )
-        slots = await inputs.integer_input(self.ctx, self.check, delete_after=True, limits=(1, 10000))
-        await self.ctx.safe_delete(msg)
+        slots = await inputs.integer_input(self.ctx, self.check, delete_after=True, limits=(1, 10000), prompt=msg)
 
         await self.update_tourney(total_slots=slots)
 
@@ -182,9 +183,7 @@ class TourneyEditor(EsportsBaseView):
         msg = await self.ask_embed(
             "For which role do you want me to open registrations?\n\n" "`Mention the role or Enter its ID.`"
         )
-        role = await inputs.role_input(self.ctx, self.check, delete_after=True)
-
-        await self.ctx.safe_delete(msg)
+        role = await inputs.role_input(self.ctx, self.check, delete_after=True, prompt=msg)
 
         await self.update_tourney(open_role_id=role.id)
 
@@ -226,8 +225,7 @@ class TourneyEditor(EsportsBaseView):
             image="https://cdn.discordapp.com/attachments/851846932593770496/900977642382163988/unknown.png",
         )
 
-        msg = await inputs.string_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(m)
+        msg = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=m)
 
         msg = truncate_string(msg, 350)
         if msg.lower().strip() == "none":
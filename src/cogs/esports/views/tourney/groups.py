@@ -52,8 +52,7 @@ class TourneyGroupManager(EsportsBaseView):
             "`Make sure I have embed_links and manage_webhooks permission there.`"
         )
 
-        _channel = await inputs.channel_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.maybe_delete(m)
+        _channel = await inputs.channel_input(self.ctx, self.check, delete_after=True, prompt=m)
 
         if not _channel.permissions_for(self.ctx.guild.me).manage_webhooks:
             return await self.error_embed(f"Make sure I have `manage_webhooks` permission in {_channel.mention}.")
@@ -97,8 +96,7 @@ class TourneyGroupManager(EsportsBaseView):
             image="https://cdn.discordapp.com/attachments/851846932593770496/901862381473374299/unknown.png",
         )
 
-        _roleinfo = await inputs.string_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(m)
+        _roleinfo = await inputs.string_input(self.ctx, self.check, delete_after=True, prompt=m)
 
         if (_roleinfo := _roleinfo.strip()) == "cancel":
             return
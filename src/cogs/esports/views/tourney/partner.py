@@ -44,9 +44,7 @@ class MediaPartnerView(EsportsBaseView):
 
         m = await self.ask_embed("Enter the tourney ID of the tournament you want to partner with.")
 
-        tourney_id = await integer_input(self.ctx, self.check, delete_after=True)
-
-        await self.ctx.safe_delete(m)
+        tourney_id = await integer_input(self.ctx, self.check, delete_after=True, prompt=m)
 
         tourney = await Tourney.get_or_none(pk=tourney_id)
         if tourney is None or not (guild := tourney.guild):
@@ -73,12 +71,10 @@ class MediaPartnerView(EsportsBaseView):
         m = await self.ask_embed(
             "Which channel do you want to use for Media-Partner?\n\n" "`Mention the channel or enter its ID.`"
         )
-        channel = await channel_input(self.ctx, self.check, delete_after=True)
-
-        await self.ctx.safe_delete(m)
+        channel = await channel_input(self.ctx, self.check, delete_after=True, prompt=m)
 
         perms = channel.permissions_for(self.ctx.me)
-        if not all((perms.add_reactions, perms.manage_messages, perms.embed_links, perms.use_external_emojis)):
+        if not (perms.add_reactions and perms.manage_messages and perms.embed_links and perms.use_external_emojis):
             return await self.error_embed(
                 f"Kindly make sure I have the following permissions in {channel.mention}:\n\n"
                 "- Add Reactions\n- Manage Messages\n- Embed Links\n- Use External Emojis"
@@ -106,8 +102,7 @@ class MediaPartnerView(EsportsBaseView):
             "`Note that this will not impact slots in anyway.`"
         )
 
-        _channel = await channel_input(self.ctx, self.check, delete_after=True)
-        await self.ctx.safe_delete(m)
+        _channel = await channel_input(self.ctx, self.check, delete_after=True, prompt=m)
 
         if not await self.tourney.media_partners.filter(pk=_channel.id).exists():
             return await self.error_embed("This is not a media-partner channel of {0}".format(self.tourney))
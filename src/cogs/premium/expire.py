@@ -20,6 +20,10 @@ async def deactivate_premium(guild_id: int):
     _t: typing.List[Tourney] = (await Tourney.filter(guild_id=guild_id).order_by("id"))[2:]
     await Tourney.filter(id__in=(t.pk for t in _t)).delete()
 
+    from cogs.esports.helpers import invalidate_registration_channels
+
+    await invalidate_registration_channels(guild_id)
+
     _tc: typing.List[TagCheck] = (await TagCheck.filter(guild_id=guild_id).order_by("id"))[1:]
     await TagCheck.filter(id__in=(t.pk for t in _tc)).delete()
 
@@ -28,8 +28,9 @@ class Tourney(BaseDbModel):
     id = fields.BigIntField(pk=True, index=True)
     guild_id = fields.BigIntField()
     name = fields.CharField(max_length=30, default="Quotient-Tourney")
-    registration_channel_id = fields.BigIntField(index=True)
-    confirm_channel_id = fields.BigIntField()
+    # generate_schemas won't add these indexes to existing tables, run `aerich migrate` & `aerich upgrade` for them.
+    registration_channel_id = fields.BigIntField(unique=True)
+    confirm_channel_id = fields.BigIntField(index=True)
     role_id = fields.BigIntField()
     required_mentions = fields.SmallIntField(default=4,validators=[ValueRangeValidator(range(0, 11))])
     total_slots = fields.SmallIntField(validators=[ValueRangeValidator(range(1, 10001))])
@@ -24,7 +24,7 @@ async def read_items(_shots: List[SS]):
                 continue
 
             _result.append(
-                ImageResponse(
+                ImageResponse.construct(
                     url=_.url,
                     dhash=str(await get_image_dhash(_image)),
                     phash=str(await get_image_phash(_image)),
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from contextlib import suppress
+from functools import lru_cache
 import aiohttp
 import asyncio
-import dateparser
+import re
+import time
+import yarl
+import posixpath
+from dateparser.date import DateDataParser
 from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
 from discord.ext.commands.converter import RoleConverter, TextChannelConverter, MemberConverter
 
 
@@ -15,61 +22,217 @@ import discord
 
 from discord.ext.commands import Context
 
+_K1, _K2 = keycap_digit(1), keycap_digit(2)
+_URL_CHECK_TIMEOUT = aiohttp.ClientTimeout(total=5)
 
-async def safe_delete(message) -> bool:
-    try:
+# url -> (content-type, expires at), least recently used urls are dropped first.
+_IMG_CACHE: OrderedDict[str, Tuple[Optional[str], float]] = OrderedDict()
+_IMG_CACHE_SIZE = 1024
+_IMG_CACHE_TTL = 600
+
+_DATE_PARSER = DateDataParser(languages=["en"], settings={"TIMEZONE": "Asia/Kolkata", "RETURN_AS_TIMEZONE_AWARE": True})
+
+# content-type of these is predictable from the extension, no need to ask the host.
+_FAST_HOSTS = ("cdn.discordapp.com", "media.discordapp.net", "i.imgur.com")
+_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif")
+
+_MENTION_RE = re.compile(r"<(?:#|@&)(\d{15,20})>$")
+_ID_RE = re.compile(r"(\d{15,20})$")
+
+_TEXT_CHANNEL_CONVERTER = TextChannelConverter()
+_ROLE_CONVERTER = RoleConverter()
+_MEMBER_CONVERTER = MemberConverter()
+
+_REQUIRED_BASIC = discord.Permissions(read_messages=True, send_messages=True, embed_links=True).value
+_REQUIRED_EXTRA = discord.Permissions(
+    manage_channels=True, add_reactions=True, use_external_emojis=True, manage_permissions=True, manage_messages=True
+).value
+_DANGEROUS = discord.Permissions(
+    administrator=True, manage_channels=True, manage_roles=True, kick_members=True, ban_members=True
+).value
+
+
+class MessageRouter:
+    """
+    A single on_message listener that hands messages to the input helpers waiting in that channel.
+
+    Unlike bot.wait_for, a message is only checked against the waiters of its own channel
+    and is delivered to at most one of them.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.waiters: Dict[int, List[Tuple[Callable, asyncio.Future]]] = {}
+
+        bot.add_listener(self.on_message)
+
+    async def on_message(self, message: discord.Message):
+        waiters = self.waiters.get(message.channel.id)
+        if not waiters:
+            return
+
+        for waiter in waiters[:]:
+            check, future = waiter
+            if future.done():
+                waiters.remove(waiter)
+                continue
+
+            try:
+                result = check(message)
+            except Exception as e:
+                future.set_exception(e)
+                waiters.remove(waiter)
+            else:
+                if result:
+                    future.set_result(message)
+                    waiters.remove(waiter)
+                    break
+
+        if not waiters:
+            self.waiters.pop(message.channel.id, None)
+
+    async def get(self, channel_id: int, *, check: Callable, timeout: Optional[float] = None) -> discord.Message:
+        future = self.bot.loop.create_future()
+        waiter = (check, future)
+        self.waiters.setdefault(channel_id, []).append(waiter)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            waiters = self.waiters.get(channel_id, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self.waiters.pop(channel_id, None)
+
+
+_router: Optional[MessageRouter] = None
+
+
+async def wait_for_message(ctx: Context, check: Callable, timeout=120) -> discord.Message:
+    global _router
+    if _router is None:
+        _router = MessageRouter(ctx.bot)
+
+    return await _router.get(ctx.channel.id, check=check, timeout=timeout)
+
+
+def _snowflake(content: str) -> Optional[int]:
+    """Returns the id given a raw id or a channel/role mention."""
+    match = _MENTION_RE.match(content) or _ID_RE.match(content)
+    if match:
+        return int(match.group(1))
+
+
+@lru_cache(maxsize=128)
+def _make_default_check(channel_id: int, author_id: int):
+    def check(message: discord.Message):
+        return message.channel.id == channel_id and message.author.id == author_id
+
+    return check
+
+
+async def safe_delete(message):
+    with suppress(discord.Forbidden, discord.NotFound):
         await message.delete()
-    except (discord.Forbidden, discord.NotFound):
-        return False
-    else:
-        return True
 
 
-async def channel_input(ctx: Context, check=None, timeout=120, delete_after=False, check_perms=True):
-    check = check or (lambda m: m.channel == ctx.channel or m.author == ctx.author)
+async def delete_messages(ctx: Context, *messages: discord.Message):
+    """
+    Delete the prompt and user reply of an input in one bulk-delete request if possible.
+    """
+    messages = [m for m in messages if m is not None]
+
+    if (
+        len(messages) > 1
+        and all(m.channel.id == ctx.channel.id for m in messages)
+        and ctx.channel.permissions_for(ctx.me).manage_messages
+    ):
+        with suppress(discord.HTTPException):
+            return await ctx.channel.delete_messages(messages)
+
+    for message in messages:
+        await safe_delete(message)
+
+
+def _remember_content_type(url: str, res: aiohttp.ClientResponse) -> Optional[str]:
+    content_type = res.headers.get("content-type")
+    if res.status < 300:
+        _IMG_CACHE[url] = (content_type, time.monotonic() + _IMG_CACHE_TTL)
+        _IMG_CACHE.move_to_end(url)
+        if len(_IMG_CACHE) > _IMG_CACHE_SIZE:
+            _IMG_CACHE.popitem(last=False)
+
+    return content_type
+
+
+async def _url_content_type(session: aiohttp.ClientSession, url: str) -> Optional[str]:
+    """
+    Content-Type of a url without downloading its body.
+    """
+    cached = _IMG_CACHE.get(url)
+    if cached and cached[1] > time.monotonic():
+        _IMG_CACHE.move_to_end(url)
+        return cached[0]
+
+    async with session.head(url, allow_redirects=True, timeout=_URL_CHECK_TIMEOUT) as res:
+        if res.status != 405:
+            return _remember_content_type(url, res)
+
+    # some hosts don't allow HEAD, ask for a single byte instead.
+    async with session.get(url, headers={"Range": "bytes=0-0"}, timeout=_URL_CHECK_TIMEOUT) as res:
+        return _remember_content_type(url, res)
+
+
+async def channel_input(ctx: Context, check=None, timeout=120, delete_after=False, check_perms=True, prompt=None):
+    check = check or _make_default_check(ctx.channel.id, ctx.author.id)
     try:
-        message: discord.Message = await ctx.bot.wait_for("message", check=check, timeout=timeout)
+        message: discord.Message = await wait_for_message(ctx, check, timeout)
     except asyncio.TimeoutError:
         raise InputError("You failed to select a channel in time. Try again!")
 
     else:
-        channel = await TextChannelConverter().convert(ctx, message.content)
+        channel = None
+        if (_id := _snowflake(message.content.strip())) is not None:
+            channel = ctx.guild.get_channel(_id)
+
+        if not isinstance(channel, discord.TextChannel):
+            channel = await _TEXT_CHANNEL_CONVERTER.convert(ctx, message.content)
 
-        perms = channel.permissions_for(ctx.me)
+        perms = channel.permissions_for(ctx.me).value
 
-        if not all((perms.read_messages, perms.send_messages, perms.embed_links)):
+        if perms & _REQUIRED_BASIC != _REQUIRED_BASIC:
             raise InputError(
                 f"Please make sure I have the following perms in {channel.mention}:\n"
                 "`read_messages`,`send_messages`,`embed_links`."
             )
 
         if check_perms:
-            if not all(
-                (
-                    perms.manage_channels,
-                    perms.add_reactions,
-                    perms.use_external_emojis,
-                    perms.manage_permissions,
-                    perms.manage_messages,
-                )
-            ):
+            if perms & _REQUIRED_EXTRA != _REQUIRED_EXTRA:
                 raise InputError(
                     f"Please make sure I have the following perms in {channel.mention}:\n"
                     "- `add reactions`\n- `use external emojis`\n- `manage channel`\n- `manage permissions`\n"
                     "- `manage messages`"
                 )
         if delete_after:
-            await safe_delete(message)
+            await delete_messages(ctx, message, prompt)
 
         return channel
 
 
-async def role_input(ctx: Context, check=None, timeout=120, hierarchy=True, check_perms=True, delete_after=False):
-    check = check or (lambda m: m.channel == ctx.channel or m.author == ctx.author)
+async def role_input(
+    ctx: Context, check=None, timeout=120, hierarchy=True, check_perms=True, delete_after=False, prompt=None
+):
+    check = check or _make_default_check(ctx.channel.id, ctx.author.id)
 
     try:
-        message: discord.Message = await ctx.bot.wait_for("message", check=check, timeout=timeout)
-        role = await RoleConverter().convert(ctx, message.content)
+        message: discord.Message = await wait_for_message(ctx, check, timeout)
+        role = None
+        if (_id := _snowflake(message.content.strip())) is not None:
+            role = ctx.guild.get_role(_id)
+
+        if role is None:
+            role = await _ROLE_CONVERTER.convert(ctx, message.content)
     except asyncio.TimeoutError:
         raise InputError("You failed to select a role in time. Try again!")
 
@@ -89,99 +252,81 @@ async def role_input(ctx: Context, check=None, timeout=120, hierarchy=True, chec
                     )
 
         if check_perms:
-            _perms = role.permissions
-            if any(
-                (
-                    _perms.administrator,
-                    _perms.manage_channels,
-                    _perms.manage_roles,
-                    _perms.kick_members,
-                    _perms.ban_members,
-                )
-            ):
+            if role.permissions.value & _DANGEROUS:
                 raise InputError(f"{role.mention} has dangerous permissions.")
 
         if delete_after:
-            await safe_delete(message)
+            await delete_messages(ctx, message, prompt)
 
         return role
 
 
-async def member_input(ctx: Context, check, timeout=120, delete_after=False):
+async def member_input(ctx: Context, check, timeout=120, delete_after=False, prompt=None):
     try:
-        message: discord.Message = await ctx.bot.wait_for("message", check=check, timeout=timeout)
-        member = await MemberConverter().convert(ctx, message.content)
+        message: discord.Message = await wait_for_message(ctx, check, timeout)
+        member = await _MEMBER_CONVERTER.convert(ctx, message.content)
 
     except asyncio.TimeoutError:
         raise InputError("You failed to mention a member in time. Try again!")
 
     else:
         if delete_after:
-            await safe_delete(message)
+            await delete_messages(ctx, message, prompt)
 
         return member
 
 
-async def integer_input(ctx: Context, check=None, timeout=120, limits=(None, None), delete_after=False):
-    check = check or (lambda m: m.channel == ctx.channel or m.author == ctx.author)
+async def integer_input(ctx: Context, check=None, timeout=120, limits=(None, None), delete_after=False, prompt=None):
+    check = check or _make_default_check(ctx.channel.id, ctx.author.id)
+
+    low, high = limits
+    max_len = len(str(high)) if high is not None else None
 
     def new_check(message: discord.Message):
         if not check(message):
             return False
 
-        try:
-            if limits[1] is not None:
-                if len(message.content) > len(str(limits[1])):  # This is for safe side, memory errors u know :)
-                    return False
+        if max_len is not None and len(message.content) > max_len:  # This is for safe side, memory errors u know :)
+            return False
 
+        try:
             digit = int(message.content)
-
         except ValueError:
             return False
-        else:
-            if not any(limits):  # No Limits
-                return True
-
-            low, high = limits
 
-            if all(limits):
-                return low <= digit <= high
-            if low is not None:
-                return low <= digit
-            return high <= digit
+        if low is not None and digit < low:
+            return False
+        if high is not None and digit > high:
+            return False
+        return True
 
     try:
-        message: discord.Message = await ctx.bot.wait_for("message", check=new_check, timeout=timeout)
+        message: discord.Message = await wait_for_message(ctx, new_check, timeout)
     except asyncio.TimeoutError:
         raise InputError("You failed to select a number in time. Try again!")
     else:
         if delete_after:
-            await safe_delete(message)
+            await delete_messages(ctx, message, prompt)
 
         return int(message.content)
 
 
-async def time_input(ctx: Context, check, timeout=120, delete_after=False):
+async def time_input(ctx: Context, check, timeout=120, delete_after=False, prompt=None):
     try:
-        message: discord.Message = await ctx.bot.wait_for("message", check=check, timeout=timeout)
+        message: discord.Message = await wait_for_message(ctx, check, timeout)
     except asyncio.TimeoutError:
         raise InputError("Timeout, You have't responsed in time. Try again!")
     else:
         try:
-            parsed = dateparser.parse(
-                message.content,
-                settings={
-                    "RELATIVE_BASE": datetime.now(tz=IST),
-                    "TIMEZONE": "Asia/Kolkata",
-                    "RETURN_AS_TIMEZONE_AWARE": True,
-                },
-            )
+            parsed = _DATE_PARSER.get_date_data(message.content).date_obj
 
             if delete_after:
-                await safe_delete(message)
+                await delete_messages(ctx, message, prompt)
 
-            if datetime.now(tz=IST) > parsed:
-                parsed = parsed + timedelta(hours=24)
+            gap = datetime.now(tz=IST) - parsed
+            if gap > timedelta():
+                # times without a date are parsed on the server's date, which can be a day behind IST.
+                parsed += timedelta(days=gap.days + 1 if gap < timedelta(days=2) else 1)
 
             return parsed
 
@@ -189,29 +334,29 @@ async def time_input(ctx: Context, check, timeout=120, delete_after=False):
             raise InputError("This isn't valid time format.")
 
 
-async def string_input(ctx: Context, check=None, timeout=120, delete_after=False):
-    check = check or (lambda m: m.channel == ctx.channel or m.author == ctx.author)
+async def string_input(ctx: Context, check=None, timeout=120, delete_after=False, prompt=None):
+    check = check or _make_default_check(ctx.channel.id, ctx.author.id)
 
     try:
-        message: discord.Message = await ctx.bot.wait_for("message", check=check, timeout=timeout)
+        message: discord.Message = await wait_for_message(ctx, check, timeout)
     except asyncio.TimeoutError:
         raise InputError("Took too long. Good Bye.")  # This would sound cooler.
     else:
         if delete_after:
-            await safe_delete(message)
+            await delete_messages(ctx, message, prompt)
 
         return message.content
 
 
-async def image_input(ctx: Context, check, timeout=120, delete_after=False):
+async def image_input(ctx: Context, check, timeout=120, delete_after=False, prompt=None):
     try:
-        message: discord.Message = await ctx.bot.wait_for("message", check=check, timeout=timeout)
+        message: discord.Message = await wait_for_message(ctx, check, timeout)
     except asyncio.TimeoutError:
         raise InputError("Took too long. Good Bye.")
 
     else:
         if delete_after:
-            await safe_delete(message)
+            await delete_messages(ctx, message, prompt)
 
         if message.content.strip().lower() == "none":
             return None
@@ -221,24 +366,27 @@ async def image_input(ctx: Context, check, timeout=120, delete_after=False):
         if message.attachments and message.attachments[0].content_type in _image_formats:
             return message.attachments[0].proxy_url
 
+        url = message.content.strip()
+        with suppress(ValueError):
+            parsed = yarl.URL(url)
+            if parsed.host in _FAST_HOSTS and posixpath.splitext(parsed.path)[1].lower() in _IMAGE_SUFFIXES:
+                return url
+
         result = None
-        with suppress(aiohttp.InvalidURL):
-            res = await ctx.bot.session.get(message.content)
-            if res.headers["content-type"] in _image_formats:
+        with suppress(aiohttp.ClientError, asyncio.TimeoutError):
+            if await _url_content_type(ctx.bot.session, message.content) in _image_formats:
                 result = message.content
 
         return result
 
 
 async def text_or_embed(ctx: Context, check, timeout=120, delete_after=False):
-    reactions = (keycap_digit(1), keycap_digit(2))
+    reactions = (_K1, _K2)
 
     def react_check(reaction, user):
         return user == ctx.author and str(reaction.emoji) in reactions
 
-    msg = await ctx.simple(
-        f"What do you want the content to be?\n\n{keycap_digit(1)} | Simple Text\n{keycap_digit(2)} | Embed"
-    )
+    msg = await ctx.simple(f"What do you want the content to be?\n\n{_K1} | Simple Text\n{_K2} | Embed")
 
     for reaction in reactions:
         await msg.add_reaction(reaction)
@@ -248,7 +396,7 @@ async def text_or_embed(ctx: Context, check, timeout=120, delete_after=False):
     if delete_after:
         await safe_delete(msg)
 
-    if str(reaction.emoji) == keycap_digit(1):
+    if str(reaction.emoji) == _K1:
         msg = await ctx.simple("Kindly enter the text now.")
         text = await string_input(ctx, check, delete_after=True)
 
@@ -257,5 +405,5 @@ async def text_or_embed(ctx: Context, check, timeout=120, delete_after=False):
 
         return text
 
-    if str(reaction.emoji) == keycap_digit(2):
+    if str(reaction.emoji) == _K2:
         msg = await ctx.simple(f"embed ki .......")